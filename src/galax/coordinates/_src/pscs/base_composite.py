@@ -4,15 +4,16 @@ __all__ = ["AbstractCompositePhaseSpaceCoordinate"]
 
 from abc import abstractmethod
 from collections.abc import Hashable, Mapping
+from functools import cached_property
 from types import MappingProxyType
 from typing import Any, ClassVar, cast
 
 import equinox as eqx
+import numpy as np
 from jaxtyping import Shaped
 from plum import dispatch
 
 import coordinax as cx
-import quaxed.numpy as jnp
 import unxt as u
 from dataclassish import field_items
 from xmmutablemap import ImmutableMap
@@ -128,10 +129,12 @@ class AbstractCompositePhaseSpaceCoordinate(  # type: ignore[misc,unused-ignore]
     # ==========================================================================
     # Array API
 
-    @property
+    @cached_property
     def _shape_tuple(self) -> tuple[gt.Shape, ComponentShapeTuple]:
         """Batch and component shapes.
 
+        The components are immutable, so this is computed once and cached.
+
         Examples
         --------
         >>> import unxt as u
@@ -149,8 +152,7 @@ class AbstractCompositePhaseSpaceCoordinate(  # type: ignore[misc,unused-ignore]
         >>> cwt._shape_tuple
         ((2,), ComponentShapeTuple(q=3, p=3, t=1))
         """
-        # TODO: speed up
-        batch_shape = jnp.broadcast_shapes(*[psp.shape for psp in self.values()])
+        batch_shape = np.broadcast_shapes(*[psp.shape for psp in self.values()])
         if not batch_shape:
             batch_shape = (len(self),)
         else:
@@ -159,6 +161,10 @@ class AbstractCompositePhaseSpaceCoordinate(  # type: ignore[misc,unused-ignore]
         return batch_shape, shape
 
     def __len__(self) -> int:
+        return self._len
+
+    @cached_property
+    def _len(self) -> int:
         # Length is the sum of the lengths of the components.
         # For length-0 components, we assume a length of 1.
         return sum([len(w) or 1 for w in self.values()])
@@ -8,10 +8,10 @@ from typing import Any, ClassVar, final
 from typing_extensions import override
 
 import equinox as eqx
+import jax
 from plum import dispatch
 
 import coordinax as cx
-import quaxed.numpy as jnp
 import unxt as u
 from dataclassish.converters import Unless
 
@@ -156,7 +156,7 @@ class PhaseSpaceCoordinate(AbstractBasicPhaseSpaceCoordinate):
         pbatch, pshape = vector_batched_shape(self.p)
         tbatch, _ = batched_shape(self.t, expect_ndim=0)
         tshape = 1
-        batch_shape = jnp.broadcast_shapes(qbatch, pbatch, tbatch)
+        batch_shape = jax.lax.broadcast_shapes(qbatch, pbatch, tbatch)
         return batch_shape, ComponentShapeTuple(q=qshape, p=pshape, t=tshape)
 
 
@@ -8,10 +8,10 @@ from typing import Any, ClassVar, NamedTuple
 from typing_extensions import override
 
 import equinox as eqx
+import jax
 from plum import dispatch
 
 import coordinax as cx
-import quaxed.numpy as jnp
 import unxt as u
 from dataclassish.converters import Unless
 
@@ -174,7 +174,7 @@ class PhaseSpacePosition(AbstractPhaseSpaceObject):
         """Batch, component shape."""
         qbatch, qshape = vector_batched_shape(self.q)
         pbatch, pshape = vector_batched_shape(self.p)
-        batch_shape = jnp.broadcast_shapes(qbatch, pbatch)
+        batch_shape = jax.lax.broadcast_shapes(qbatch, pbatch)
         return batch_shape, ComponentShapeTuple(q=qshape, p=pshape)
 
 
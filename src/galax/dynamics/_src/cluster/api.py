@@ -47,6 +47,11 @@ def lagrange_points(
 ) -> L1L2LagrangePoints:
     """Compute the lagrange points of a cluster in a host potential.
 
+    The L1 and L2 points lie along the radial direction of the cluster, at
+    ``x - r_t r_hat`` and ``x + r_t r_hat`` respectively, where ``r_t`` is the
+    King (1962) tidal radius. The tidal radius is therefore also available from
+    the result, as the distance from ``x`` to either point.
+
     Examples
     --------
     >>> import unxt as u
@@ -65,6 +70,10 @@ def lagrange_points(
     >>> lpts.l2
     Quantity['length'](Array([8.02929074, 0. , 0. ], dtype=float64), unit='kpc')
 
+    >>> import quaxed.numpy as jnp
+    >>> jnp.linalg.vector_norm(lpts.l2 - x)
+    Quantity['length'](Array(0.02929074, dtype=float64), unit='kpc')
+
     """
     raise NotImplementedError  # pragma: no cover
 
@@ -18,16 +18,52 @@ from .api import L1L2LagrangePoints
 from .radius import tidal_radius_king1962
 
 
-@dispatch
 @partial(jax.jit)
+def _lagrange_points_core(
+    potential: gp.AbstractPotential,
+    x: gt.LengthBBtSz3,
+    v: gt.SpeedBBtSz3,
+    /,
+    *,
+    mass: gt.MassBBtSz0,
+    t: gt.TimeBBtSz0,
+) -> L1L2LagrangePoints:
+    """Compute the lagrange points from `unxt.Quantity` positions & velocities.
+
+    The `lagrange_points` overloads all forward here directly, so the plum
+    dispatch is only paid once, at the user-facing call.
+
+    """
+    r_hat = x / jnp.linalg.vector_norm(x, axis=-1, keepdims=True)
+    r_t = tidal_radius_king1962(potential, x, v, mass=mass, t=t)
+    return _lagrange_from_rt(x, r_hat, r_t)
+
+
+def _lagrange_from_rt(
+    x: gt.LengthBBtSz3, r_hat: gt.BBtQuSz3, r_t: gt.BBtRealQuSz0, /
+) -> L1L2LagrangePoints:
+    """Compute the lagrange points from a precomputed tidal radius.
+
+    Callers that already have the tidal radius ``r_t`` and the radial unit
+    vector ``r_hat`` of the cluster position ``x`` can use this directly,
+    instead of recomputing ``r_t`` through `lagrange_points`.
+
+    """
+    r_t = r_t[..., None]
+    l1 = x - r_hat * r_t  # close
+    l2 = x + r_hat * r_t  # far
+    return L1L2LagrangePoints(l1=l1, l2=l2)
+
+
+@dispatch
 def lagrange_points(
     potential: gp.AbstractPotential,
-    x: gt.LengthSz3 | cx.vecs.AbstractPos3D,
-    v: gt.SpeedSz3 | cx.vecs.AbstractVel3D,
+    x: gt.LengthBBtSz3 | cx.vecs.AbstractPos3D,
+    v: gt.SpeedBBtSz3 | cx.vecs.AbstractVel3D,
     /,
     *,
-    mass: gt.MassSz0,
-    t: gt.TimeSz0,
+    mass: gt.MassBBtSz0,
+    t: gt.TimeBBtSz0,
 ) -> L1L2LagrangePoints:
     """Compute the lagrange points of a cluster in a host potential.
 
@@ -35,13 +71,13 @@ def lagrange_points(
     ----------
     potential : `galax.potential.AbstractPotential`
         The gravitational potential of the host.
-    x: Quantity[float, (3,), "length"]
+    x: Quantity[float, (*batch, 3), "length"]
         Cartesian 3D position ($x$, $y$, $z$)
-    v: Quantity[float, (3,), "speed"]
+    v: Quantity[float, (*batch, 3), "speed"]
         Cartesian 3D velocity ($v_x$, $v_y$, $v_z$)
-    mass: Quantity[float, (), "mass"]
+    mass: Quantity[float, (*batch,), "mass"]
         Cluster mass.
-    t: Quantity[float, (), "time"]
+    t: Quantity[float, (*batch,), "time"]
         Time.
 
     Examples
@@ -73,14 +109,20 @@ def lagrange_points(
     >>> lpts2.l2
     Quantity['length'](Array([8.02929074, 0. , 0. ], dtype=float64), unit='kpc')
 
+    Batches of clusters are evaluated in a single call, e.g. along an orbit:
+
+    >>> xs = u.Quantity([[8.0, 0.0, 0.0], [0.0, 8.0, 0.0]], "kpc")
+    >>> vs = u.Quantity([[0.0, 220.0, 0.0], [-220.0, 0.0, 0.0]], "km/s")
+    >>> ts = u.Quantity([0.0, 0.1], "Gyr")
+    >>> lpts = lagrange_points(pot, xs, vs, mass=mass, t=ts)
+    >>> lpts.l1
+    Quantity['length'](Array([[7.97070926, 0. , 0. ],
+                              [0. , 7.97070926, 0. ]], dtype=float64), unit='kpc')
+
     """
     x = convert(x, u.Quantity)
     v = convert(v, u.Quantity)
-    r_t = tidal_radius_king1962(potential, x, v, mass=mass, t=t)
-    r_hat = cx.vecs.normalize_vector(x)
-    l1 = x - r_hat * r_t  # close
-    l2 = x + r_hat * r_t  # far
-    return L1L2LagrangePoints(l1=l1, l2=l2)
+    return _lagrange_points_core(potential, x, v, mass=mass, t=t)
 
 
 @dispatch
@@ -117,7 +159,9 @@ def lagrange_points(
     Quantity['length'](Array([8.02929074, 0. , 0. ], dtype=float64), unit='kpc')
 
     """
-    return lagrange_points(pot, space["length"], space["speed"], mass=mass, t=t)
+    x = convert(space["length"], u.Quantity)
+    v = convert(space["speed"], u.Quantity)
+    return _lagrange_points_core(pot, x, v, mass=mass, t=t)
 
 
 @dispatch
@@ -154,7 +198,9 @@ def lagrange_points(
     Quantity['length'](Array([8.02929074, 0. , 0. ], dtype=float64), unit='kpc')
 
     """
-    return lagrange_points(pot, coord.data, mass=mass, t=t)
+    x = convert(coord.data["length"], u.Quantity)
+    v = convert(coord.data["speed"], u.Quantity)
+    return _lagrange_points_core(pot, x, v, mass=mass, t=t)
 
 
 @dispatch
@@ -190,7 +236,8 @@ def lagrange_points(
     Quantity['length'](Array([8.02929074, 0. , 0. ], dtype=float64), unit='kpc')
 
     """
-    return lagrange_points(pot, w.q, w.p, mass=mass, t=w.t.squeeze())
+    x, v = convert(w.q, u.Quantity), convert(w.p, u.Quantity)
+    return _lagrange_points_core(pot, x, v, mass=mass, t=w.t.squeeze())
 
 
 @dispatch
@@ -227,7 +274,8 @@ def lagrange_points(
     Quantity['length'](Array([8.02929074, 0. , 0. ], dtype=float64), unit='kpc')
 
     """
-    return lagrange_points(pot, w.q, w.p, mass=mass, t=time)
+    x, v = convert(w.q, u.Quantity), convert(w.p, u.Quantity)
+    return _lagrange_points_core(pot, x, v, mass=mass, t=time)
 
 
 @dispatch
@@ -7,6 +7,7 @@ from typing import ClassVar, final
 
 import diffrax as dfx
 import equinox as eqx
+import jax
 import jax.numpy as jnp
 
 import coordinax as cx
@@ -70,7 +71,7 @@ class InterpolatedPhaseSpaceCoordinate(gc.AbstractBasicPhaseSpaceCoordinate):
         qbatch, qshape = vector_batched_shape(self.q)
         pbatch, pshape = vector_batched_shape(self.p)
         tbatch, _ = batched_shape(self.t, expect_ndim=0)
-        batch_shape = jnp.broadcast_shapes(qbatch, pbatch, tbatch)
+        batch_shape = jax.lax.broadcast_shapes(qbatch, pbatch, tbatch)
         return batch_shape, ComponentShapeTuple(q=qshape, p=pshape, t=1)
 
 
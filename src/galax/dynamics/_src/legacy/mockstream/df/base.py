@@ -100,12 +100,18 @@ class AbstractStreamDF(eqx.Module, strict=True):  # type: ignore[call-arg, misc]
             else prog_mass
         )
 
+        # A constant mass is passed as a scalar, which broadcasts against the
+        # release times, rather than being evaluated at each of them.
+        mprog_ts = (
+            mprog.m_tot if isinstance(mprog, ConstantMassProtenitor) else mprog(ts)
+        )
+
         x_lead, v_lead, x_trail, v_trail = self._sample(
             rng,
             pot,
             convert(prog_orbit.q, u.Quantity),
             convert(prog_orbit.p, u.Quantity),
-            mprog(ts),
+            mprog_ts,
             ts,
         )
 
@@ -2,9 +2,11 @@
 
 __all__ = ["ProgenitorMassCallable", "ConstantMassProtenitor"]
 
+from functools import partial
 from typing import Protocol, runtime_checkable
 
 import equinox as eqx
+import jax
 
 import quaxed.numpy as jnp
 import unxt as u
@@ -39,6 +41,7 @@ class ConstantMassProtenitor(eqx.Module):  # type: ignore[misc]
     m_tot: gt.MassSz0 = eqx.field(converter=u.Quantity["mass"].from_)
     """The progenitor mass."""
 
+    @partial(jax.jit)
     def __call__(self, t: gt.TimeBtSz0, /) -> gt.MassBtSz0:
         """Return the constant mass at the times.
 
@@ -47,4 +50,4 @@ class ConstantMassProtenitor(eqx.Module):  # type: ignore[misc]
         t : TimeBtSz0
             The times at which to evaluate the progenitor mass.
         """
-        return jnp.ones(t.shape) * self.m_tot
+        return jnp.broadcast_to(self.m_tot, t.shape)
@@ -5,6 +5,7 @@ __all__ = ["MockStreamArm"]
 from typing import Any, ClassVar, Protocol, cast, final, runtime_checkable
 
 import equinox as eqx
+import jax
 from plum import dispatch
 
 import coordinax as cx
@@ -61,7 +62,7 @@ class MockStreamArm(gc.AbstractBasicPhaseSpaceCoordinate):
         qbatch, qshape = vector_batched_shape(self.q)
         pbatch, pshape = vector_batched_shape(self.p)
         tbatch, _ = batched_shape(self.t, expect_ndim=0)
-        batch_shape = jnp.broadcast_shapes(qbatch, pbatch, tbatch)
+        batch_shape = jax.lax.broadcast_shapes(qbatch, pbatch, tbatch)
         return batch_shape, gc.ComponentShapeTuple(q=qshape, p=pshape, t=1)
 
 
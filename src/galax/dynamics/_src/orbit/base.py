@@ -13,7 +13,6 @@ from numpy import ndarray
 from plum import dispatch
 
 import coordinax as cx
-import quaxed.numpy as jnp
 
 import galax.coordinates as gc
 import galax.potential as gp
@@ -83,7 +82,7 @@ class AbstractOrbit(gc.AbstractBasicPhaseSpaceCoordinate):
         qbatch, qshape = vector_batched_shape(self.q)
         pbatch, pshape = vector_batched_shape(self.p)
         tbatch, _ = batched_shape(self.t, expect_ndim=1)
-        batch_shape = jnp.broadcast_shapes(qbatch, pbatch, tbatch)
+        batch_shape = jax.lax.broadcast_shapes(qbatch, pbatch, tbatch)
         return batch_shape, gc.ComponentShapeTuple(q=qshape, p=pshape, t=1)
 
     # ==========================================================================
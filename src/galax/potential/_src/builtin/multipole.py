@@ -7,13 +7,14 @@ __all__ = [
     "MultipolePotential",
 ]
 
+import math
 from dataclasses import KW_ONLY
-from functools import partial
+from functools import cache, partial
 from typing import final
 
 import jax
+import numpy as np
 from equinox import field
-from jax.scipy.special import sph_harm
 from jaxtyping import Array, Float
 
 import quaxed.numpy as jnp
@@ -81,24 +82,8 @@ class MultipoleInnerPotential(AbstractMultipolePotential):
         Tlm = self.Tlm(t, ustrip=self.units["dimensionless"])
         xyz = u.ustrip(AllowValue, self.units["length"], xyz)
 
-        # spherical coordinates
-        is_scalar = xyz.ndim == 1
-        s, theta, phi = cartesian_to_normalized_spherical(jnp.atleast_2d(xyz), r_s)
-
-        # Compute the summation over l and m
-        l_max = self.l_max
-        ls, ms = jnp.tril_indices(l_max + 1)
-
-        # TODO: vectorize compute_Ylm over l, m, then don't need a vmap?
-        def summand(l: int, m: int) -> Float[Array, "*batch"]:
-            cPlm, sPlm = compute_Ylm(l, m, theta, phi, l_max=l_max)
-            return jnp.pow(s, l) * (Slm[l, m] * cPlm + Tlm[l, m] * sPlm)
-
-        summation = jnp.sum(jax.vmap(summand, in_axes=(0, 0))(ls, ms), axis=0)
-        if is_scalar:
-            summation = summation[0]
-
-        return self.constants["G"].value * m_tot / r_s * summation
+        G = self.constants["G"].value
+        return _inner_potential(xyz, m_tot, r_s, Slm, Tlm, G=G, l_max=self.l_max)
 
 
 @final
@@ -143,24 +128,8 @@ class MultipoleOuterPotential(AbstractMultipolePotential):
         Tlm = self.Tlm(t, ustrip=self.units["dimensionless"])
         xyz = u.ustrip(AllowValue, self.units["length"], xyz)
 
-        # spherical coordinates
-        is_scalar = xyz.ndim == 1
-        s, theta, phi = cartesian_to_normalized_spherical(jnp.atleast_2d(xyz), r_s)
-
-        # Compute the summation over l and m
-        l_max = self.l_max
-        ls, ms = jnp.tril_indices(l_max + 1)
-
-        # TODO: vectorize compute_Ylm over l, m, then don't need a vmap?
-        def summand(l: int, m: int) -> Float[Array, "*batch"]:
-            cPlm, sPlm = compute_Ylm(l, m, theta, phi, l_max=l_max)
-            return jnp.pow(s, -(l + 1)) * (Slm[l, m] * cPlm + Tlm[l, m] * sPlm)
-
-        summation = jnp.sum(jax.vmap(summand, in_axes=(0, 0))(ls, ms), axis=0)
-        if is_scalar:
-            summation = summation[0]
-
-        return self.constants["G"].value * m_tot / r_s * summation
+        G = self.constants["G"].value
+        return _outer_potential(xyz, m_tot, r_s, Slm, Tlm, G=G, l_max=self.l_max)
 
 
 @final
@@ -217,31 +186,120 @@ class MultipolePotential(AbstractMultipolePotential):
 
         xyz = u.ustrip(AllowValue, self.units["length"], xyz)
 
-        # spherical coordinates
-        is_scalar = xyz.ndim == 1
-        s, theta, phi = cartesian_to_normalized_spherical(jnp.atleast_2d(xyz), r_s)
-
-        # Compute the summation over l and m
-        l_max = self.l_max
-        ls, ms = jnp.tril_indices(l_max + 1)
-
-        # TODO: vectorize compute_Ylm over l, m, then don't need a vmap?
-        def summand(l: int, m: int) -> Float[Array, "*batch"]:
-            cPlm, sPlm = compute_Ylm(l, m, theta, phi, l_max=l_max)
-            inner = jnp.pow(s, l) * (ISlm[l, m] * cPlm + ITlm[l, m] * sPlm)
-            outer = jnp.pow(s, -l - 1) * (OSlm[l, m] * cPlm + OTlm[l, m] * sPlm)
-            return inner + outer
-
-        summation = jnp.sum(jax.vmap(summand, in_axes=(0, 0))(ls, ms), axis=0)
-        if is_scalar:
-            summation = summation[0]
-
-        return self.constants["G"].value * m_tot / r_s * summation
+        G = self.constants["G"].value
+        return _multipole_potential(
+            xyz, m_tot, r_s, ISlm, ITlm, OSlm, OTlm, G=G, l_max=self.l_max
+        )
 
 
 # ===== Helper functions =====
 
 
+@partial(jax.jit, static_argnames=("l_max",))
+def _inner_potential(
+    xyz: gt.BtSz3,
+    m_tot: gt.Sz0,
+    r_s: gt.Sz0,
+    Slm: Float[Array, "L L"],
+    Tlm: Float[Array, "L L"],
+    /,
+    *,
+    G: gt.Sz0,
+    l_max: int,
+) -> gt.BtFloatSz0:
+    """Multipole inner expansion potential, from unitless parameters."""
+    # spherical coordinates
+    is_scalar = xyz.ndim == 1
+    s, cos_theta, phi = cartesian_to_normalized_spherical(jnp.atleast_2d(xyz), r_s)
+
+    # Compute the summation over l and m. Only the m <= l coefficients
+    # contribute, so the upper triangle is masked out of the sum.
+    tril = _tril_mask(l_max)
+    Slm, Tlm = jnp.where(tril, Slm, 0), jnp.where(tril, Tlm, 0)
+    s_pow = _powers(s, l_max)  # s^l
+    summation = _ylm_sum(cos_theta, phi, s_pow[None], Slm[None], Tlm[None], l_max=l_max)
+    if is_scalar:
+        summation = summation[0]
+
+    return G * m_tot / r_s * summation
+
+
+@partial(jax.jit, static_argnames=("l_max",))
+def _outer_potential(
+    xyz: gt.BtSz3,
+    m_tot: gt.Sz0,
+    r_s: gt.Sz0,
+    Slm: Float[Array, "L L"],
+    Tlm: Float[Array, "L L"],
+    /,
+    *,
+    G: gt.Sz0,
+    l_max: int,
+) -> gt.BtFloatSz0:
+    """Multipole outer expansion potential, from unitless parameters."""
+    # spherical coordinates
+    is_scalar = xyz.ndim == 1
+    s, cos_theta, phi = cartesian_to_normalized_spherical(jnp.atleast_2d(xyz), r_s)
+
+    # Compute the summation over l and m. Only the m <= l coefficients
+    # contribute, so the upper triangle is masked out of the sum.
+    tril = _tril_mask(l_max)
+    Slm, Tlm = jnp.where(tril, Slm, 0), jnp.where(tril, Tlm, 0)
+    s_pow = _powers(1 / s, l_max) / s[None]  # s^-(l+1)
+    summation = _ylm_sum(cos_theta, phi, s_pow[None], Slm[None], Tlm[None], l_max=l_max)
+    if is_scalar:
+        summation = summation[0]
+
+    return G * m_tot / r_s * summation
+
+
+@partial(jax.jit, static_argnames=("l_max",))
+def _multipole_potential(
+    xyz: gt.BtSz3,
+    m_tot: gt.Sz0,
+    r_s: gt.Sz0,
+    ISlm: Float[Array, "L L"],
+    ITlm: Float[Array, "L L"],
+    OSlm: Float[Array, "L L"],
+    OTlm: Float[Array, "L L"],
+    /,
+    *,
+    G: gt.Sz0,
+    l_max: int,
+) -> gt.BtFloatSz0:
+    """Multipole inner and outer expansion potential, from unitless parameters."""
+    # spherical coordinates
+    is_scalar = xyz.ndim == 1
+    s, cos_theta, phi = cartesian_to_normalized_spherical(jnp.atleast_2d(xyz), r_s)
+
+    # Compute the summation over l and m. Only the m <= l coefficients
+    # contribute, so the upper triangle is masked out of the sum.
+    tril = _tril_mask(l_max)
+    ISlm, ITlm = jnp.where(tril, ISlm, 0), jnp.where(tril, ITlm, 0)
+    OSlm, OTlm = jnp.where(tril, OSlm, 0), jnp.where(tril, OTlm, 0)
+    si_pow = _powers(s, l_max)  # s^l
+    so_pow = 1 / (s[None] * si_pow)  # s^-(l+1)
+    summation = _ylm_sum(
+        cos_theta,
+        phi,
+        jnp.stack((si_pow, so_pow)),
+        jnp.stack((ISlm, OSlm)),
+        jnp.stack((ITlm, OTlm)),
+        l_max=l_max,
+    )
+    if is_scalar:
+        summation = summation[0]
+
+    return G * m_tot / r_s * summation
+
+
+def _powers(x: Float[Array, "*batch"], l_max: int, /) -> Float[Array, "L *batch"]:
+    """Compute ``x^l`` for ``l = 0, ..., l_max`` as a cumulative product."""
+    xs = jnp.broadcast_to(x[None], (l_max, *x.shape))
+    return jnp.concatenate((jnp.ones_like(x)[None], jnp.cumprod(xs, axis=0)))
+
+
+@partial(jax.jit)
 def cartesian_to_normalized_spherical(
     q: gt.BtSz3, r_s: gt.Sz0, /
 ) -> tuple[gt.BtFloatSz0, gt.BtFloatSz0, gt.BtFloatSz0]:
@@ -253,22 +311,138 @@ def cartesian_to_normalized_spherical(
         X = \cos(\theta) = z / r
         \phi = \tan^{-1}\left(\frac{y}{x}\right)
 
+    The components of ``q`` are read once and shared by all three outputs.
+    The polar angle is returned as :math:`X = \cos\theta`, which is what the
+    Legendre recurrences need, so no ``acos`` is evaluated.
+
+    Examples
+    --------
+    >>> import quaxed.numpy as jnp
+    >>> q = jnp.asarray([[2.0, 0, 0], [0, 0, 4.0]])
+    >>> s, cos_theta, phi = cartesian_to_normalized_spherical(q, 2.0)
+    >>> s, cos_theta, phi
+    (Array([1., 2.], dtype=float64), Array([0., 1.], dtype=float64),
+     Array([0., 0.], dtype=float64))
+
     """
-    r = jnp.linalg.vector_norm(q, axis=-1)
+    x, y, z = q[..., 0], q[..., 1], q[..., 2]
+    r = jnp.sqrt(x * x + y * y + z * z)
     s = r / r_s
-    theta = jnp.acos(q[..., 2] / r)  # theta
-    phi = jnp.atan2(q[..., 1], q[..., 0])  # atan(y/x)
-    return s, theta, phi
+    cos_theta = z / r
+    phi = jnp.atan2(y, x)  # atan(y/x)
+    return s, cos_theta, phi
 
 
-# TODO: vectorize such that it's signature="(l),(l),(N),(N)->(l, N)":
-def compute_Ylm(
-    l: int,
-    m: int,
-    theta: Float[Array, "*batch"],
+@partial(jax.jit, static_argnames=("l_max",))
+def _ylm_sum(
+    cos_theta: Float[Array, "*batch"],
     phi: Float[Array, "*batch"],
-    *,
+    s_pow: Float[Array, "K L *batch"],
+    Slm: Float[Array, "K L L"],
+    Tlm: Float[Array, "K L L"],
+    /,
     l_max: int,
-) -> tuple[Float[Array, "*batch"], Float[Array, "*batch"]]:
-    Ylm = sph_harm(jnp.atleast_1d(m), jnp.atleast_1d(l), phi, theta, n_max=l_max)
-    return Ylm.real, Ylm.imag
+) -> Float[Array, "*batch"]:
+    r"""Sum the spherical harmonic expansion up to ``l_max``.
+
+    .. math::
+
+        \sum_k \sum_{l=0}^{l_{max}} \sum_{m=0}^{l} s_{kl} \, N_l^m P_l^m(x)
+        \left( S_{klm} \cos(m\phi) + T_{klm} \sin(m\phi) \right)
+
+    with :math:`x = \cos\theta`, :math:`N_l^m` the spherical harmonic
+    normalization, and :math:`s_{kl}` the radial weights of each of the ``K``
+    expansions. This is shared by all the multipole potentials and is jitted
+    with a static ``l_max``.
+
+    The associated Legendre functions are built with the upward recurrence
+
+    .. math::
+
+        P_m^m(x) = (-1)^m (2m-1)!! \, (1 - x^2)^{m/2} \\
+        P_{m+1}^m(x) = (2m+1) \, x \, P_m^m(x) \\
+        P_{l+1}^m(x) = \frac{(2l+1) \, x \, P_l^m(x) - (l+m) \, P_{l-1}^m(x)}{l-m+1}
+
+    evaluated for all :math:`m` at once. The sum over :math:`l` is accumulated
+    by a `jax.lax.scan`, so only two rows of :math:`P_l^m` are held at a time
+    instead of the full ``(l_max + 1, l_max + 1, *batch)`` table.
+
+    """
+    sin_theta = jnp.sqrt(1 - cos_theta**2)
+    ms = np.arange(l_max + 1).reshape(-1, *(1,) * cos_theta.ndim)
+
+    # Diagonal terms P_m^m, computed for all m at once.
+    dfact = np.cumprod(np.concatenate(([1.0], np.arange(1, 2 * l_max, 2))))
+    diag = (-1.0) ** ms * dfact.reshape(ms.shape) * sin_theta[None] ** ms
+
+    # Azimuthal terms, indexed as [m, ...].
+    cos_mphi = jnp.cos(ms * phi[None])
+    sin_mphi = jnp.sin(ms * phi[None])
+
+    # Fold the normalization into the coefficients & scan over l, with the
+    # recurrence coefficients of each row as host-side constants.
+    norm = _sph_harm_norm(l_max)
+    a_lm, b_lm, d_lm = _legendre_coeffs(l_max)
+    shape = (l_max + 1, *ms.shape)
+    xs = (
+        (a_lm.reshape(shape), b_lm.reshape(shape), d_lm.reshape(shape)),
+        jnp.moveaxis(s_pow, 1, 0),
+        jnp.moveaxis(Slm * norm, 1, 0),
+        jnp.moveaxis(Tlm * norm, 1, 0),
+    )
+
+    def body(
+        carry: tuple[Array, Array, Array], x: tuple[Array, Array, Array, Array]
+    ) -> tuple[tuple[Array, Array, Array], None]:
+        prev, curr, total = carry
+        (a_l, b_l, d_l), s_l, S_l, T_l = x
+        # Accumulate row l of the expansion.
+        cw = jnp.einsum("k...,km->m...", s_l, S_l)
+        sw = jnp.einsum("k...,km->m...", s_l, T_l)
+        total = total + jnp.sum(curr * (cw * cos_mphi + sw * sin_mphi), axis=0)
+        # Upward recurrence to row l + 1.
+        nxt = a_l * cos_theta[None] * curr - b_l * prev + d_l * diag
+        return (curr, nxt, total), None
+
+    row0 = jnp.where(ms == 0, diag, 0.0)
+    init = (jnp.zeros_like(row0), row0, jnp.zeros_like(cos_theta))
+    (_, _, total), _ = jax.lax.scan(body, init, xs)
+    return total
+
+
+@cache
+def _tril_mask(l_max: int, /) -> np.ndarray:
+    """Return the (host-side) mask of the ``m <= l`` entries, indexed ``[l, m]``."""
+    mask = np.tri(l_max + 1, dtype=bool)
+    mask.flags.writeable = False
+    return mask
+
+
+@cache
+def _legendre_coeffs(l_max: int, /) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    r"""Compute the upward recurrence coefficients, indexed as ``[l, m]``.
+
+    Row ``l`` gives :math:`P_{l+1}^m = a_{lm} x P_l^m - b_{lm} P_{l-1}^m +
+    d_{lm} P_m^m`, with :math:`d_{lm} = 1` only for the new diagonal term
+    :math:`m = l + 1`.
+    """
+    ls, ms = np.indices((l_max + 1, l_max + 1))
+    lower = ms <= ls
+    denom = np.where(lower, ls - ms + 1, 1)
+    a = np.where(lower, (2 * ls + 1) / denom, 0.0)
+    b = np.where(lower, (ls + ms) / denom, 0.0)
+    d = (ms == ls + 1).astype(float)
+    for arr in (a, b, d):
+        arr.flags.writeable = False
+    return a, b, d
+
+
+@cache
+def _sph_harm_norm(l_max: int, /) -> np.ndarray:
+    """Compute the spherical harmonic normalizations, indexed as ``[l, m]``."""
+    norm = np.zeros((l_max + 1, l_max + 1))
+    for l, m in zip(*np.tril_indices(l_max + 1), strict=True):
+        ratio = math.factorial(l - m) / math.factorial(l + m)
+        norm[l, m] = math.sqrt((2 * l + 1) / (4 * math.pi) * ratio)
+    norm.flags.writeable = False
+    return norm
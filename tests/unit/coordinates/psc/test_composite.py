@@ -0,0 +1,47 @@
+"""Test `galax.coordinates.CompositePhaseSpaceCoordinate`."""
+
+import pytest
+
+import coordinax as cx
+import quaxed.numpy as jnp
+import unxt as u
+
+import galax.coordinates as gc
+
+
+@pytest.fixture
+def cw() -> gc.CompositePhaseSpaceCoordinate:
+    """Return a composite whose key order differs from its time order."""
+    # "z" sorts after "a" but is released first, so a reordering of the
+    # components is visible in ``t``, ``q`` and ``p``.
+    wz = gc.PhaseSpaceCoordinate(
+        q=u.Quantity([1, 0, 0], "kpc"),
+        p=u.Quantity([10, 0, 0], "km/s"),
+        t=u.Quantity(0, "Myr"),
+    )
+    wa = gc.PhaseSpaceCoordinate(
+        q=u.Quantity([2, 0, 0], "kpc"),
+        p=u.Quantity([20, 0, 0], "km/s"),
+        t=u.Quantity(5, "Myr"),
+    )
+    return gc.CompositePhaseSpaceCoordinate(z=wz, a=wa)
+
+
+def test_uconvert_keeps_order(cw: gc.CompositePhaseSpaceCoordinate) -> None:
+    """Test that `uconvert` keeps each component with its own time."""
+    got = u.uconvert(u.unitsystem("kpc", "Myr", "Msun", "radian"), cw)
+
+    assert list(got.keys()) == list(cw.keys())
+    assert jnp.allclose(u.ustrip("Myr", got.t), u.ustrip("Myr", cw.t))
+    assert jnp.allclose(u.ustrip("kpc", got.q.x), u.ustrip("kpc", cw.q.x))
+    assert jnp.allclose(u.ustrip("km/s", got.p.x), u.ustrip("km/s", cw.p.x))
+
+
+def test_vconvert_keeps_order(cw: gc.CompositePhaseSpaceCoordinate) -> None:
+    """Test that `vconvert` keeps each component with its own time."""
+    got = cx.vconvert(cx.vecs.CylindricalPos, cw)
+
+    assert list(got.keys()) == list(cw.keys())
+    assert jnp.allclose(u.ustrip("Myr", got.t), u.ustrip("Myr", cw.t))
+    assert jnp.allclose(u.ustrip("kpc", got.q.rho), u.ustrip("kpc", cw.q.x))
+    assert jnp.allclose(u.ustrip("km/s", got.p.rho), u.ustrip("km/s", cw.p.x))
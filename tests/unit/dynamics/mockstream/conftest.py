@@ -0,0 +1,37 @@
+"""Fixtures shared by the mock stream tests."""
+
+import jax.random as jr
+import pytest
+from jaxtyping import PRNGKeyArray
+
+import unxt as u
+
+from galax.dynamics import ChenStreamDF, FardalStreamDF
+from galax.potential import NFWPotential
+
+
+@pytest.fixture(scope="session")
+def rng_base() -> PRNGKeyArray:
+    """Seed key for the random number generator."""
+    return jr.key(12)
+
+
+@pytest.fixture(scope="session")
+def pot() -> NFWPotential:
+    """Host potential."""
+    return NFWPotential(
+        m=u.Quantity(1.0e12, "Msun"), r_s=u.Quantity(15.0, "kpc"), units="galactic"
+    )
+
+
+@pytest.fixture(scope="session")
+def fardal_df() -> FardalStreamDF:
+    """Fardal+15 mock stream DF."""
+    return FardalStreamDF()
+
+
+@pytest.fixture(scope="session")
+def chen_df() -> ChenStreamDF:
+    """Chen+24 mock stream DF."""
+    with pytest.warns(RuntimeWarning):
+        return ChenStreamDF()
@@ -1,13 +1,18 @@
 """Test :mod:`galax.dynamics.mockstream.mockstreamgenerator`."""
 
+import zlib
 from abc import ABCMeta, abstractmethod
+from collections.abc import Callable
+from functools import partial
+from typing import Any
 
+import jax
+import jax.numpy as jnp
 import jax.random as jr
 import jax.tree as jtu
 import pytest
-from jaxtyping import PRNGKeyArray
+from jaxtyping import Array, Bool, PRNGKeyArray
 
-import quaxed.numpy as jnp
 import unxt as u
 
 import galax.coordinates as gc
@@ -16,26 +21,30 @@ from galax.dynamics import (
     AbstractStreamDF,
     ChenStreamDF,
     FardalStreamDF,
+    MockStream,
     MockStreamGenerator,
 )
-from galax.potential import AbstractPotential, NFWPotential
+from galax.potential import AbstractPotential
+
+
+@jax.jit
+def _all_finite(tree: Any) -> Bool[Array, ""]:
+    """Check that all the leaves of a pytree are finite, in one reduction."""
+    return jtu.reduce(
+        lambda acc, x: acc & jnp.isfinite(x).all(),
+        tree,
+        jnp.bool_(True),  # noqa: FBT003
+    )
 
 
 class MockStreamGeneratorBase_Test(metaclass=ABCMeta):
     """Test the MockStreamGenerator class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     @abstractmethod
     def df(self) -> AbstractStreamDF: ...
 
-    @pytest.fixture
-    def pot(self) -> NFWPotential:
-        """Mock stream DF."""
-        return NFWPotential(
-            m=u.Quantity(1.0e12, "Msun"), r_s=u.Quantity(15.0, "kpc"), units="galactic"
-        )
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mockgen(
         self, df: AbstractStreamDF, pot: AbstractPotential
     ) -> MockStreamGenerator:
@@ -46,78 +55,95 @@ class MockStreamGeneratorBase_Test(metaclass=ABCMeta):
 
     # ----------------------------------------
 
-    @pytest.fixture
-    def t_stripping(self) -> gt.QuSzTime:
+    @pytest.fixture(
+        scope="class",
+        params=[256, pytest.param(8_000, marks=pytest.mark.slow)],
+        ids=["fast", "full"],
+    )
+    def t_stripping(self, request: pytest.FixtureRequest) -> gt.QuSzTime:
         """Time vector for stripping."""
-        return u.Quantity(jnp.linspace(0.0, 4e3, 8_000, dtype=float), "Myr")
+        return u.Quantity(jnp.linspace(0.0, 4e3, request.param, dtype=float), "Myr")
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def prog_w0(self) -> gc.PhaseSpaceCoordinate:
         """Progenitor initial conditions."""
         return gc.PhaseSpaceCoordinate(
-            q=u.Quantity([30, 10, 20], "kpc"),
-            p=u.Quantity([10, -150, -20], "km/s"),
+            q=u.Quantity([30.0, 10.0, 20.0], "kpc"),
+            p=u.Quantity([10.0, -150.0, -20.0], "km/s"),
             t=u.Quantity(0.0, "Myr"),
         )
 
-    @pytest.fixture
-    def prog_mass(self) -> gt.MassSz0:
+    @pytest.fixture(scope="class")
+    def prog_mass(self) -> u.Quantity:
         """Progenitor mass."""
         return u.Quantity(1e4, "Msun")
 
     @pytest.fixture
-    def rng(self) -> PRNGKeyArray:
-        """Seed number for the random number generator."""
-        return jr.key(12)
+    def rng(
+        self, rng_base: PRNGKeyArray, request: pytest.FixtureRequest
+    ) -> PRNGKeyArray:
+        """Random number generator key, independent for each test.
 
-    @pytest.fixture
+        Only the key is fresh per test. It is folded in from ``rng_base``,
+        which is built once per session.
+        """
+        return jr.fold_in(rng_base, zlib.crc32(request.node.name.encode()))
+
+    @pytest.fixture(scope="class")
     def vmapped(self) -> bool:
         """Whether to use `jax.vmap`."""
         return False  # TODO: test both True and False
 
+    @pytest.fixture(scope="class")
+    def compiled_run(
+        self,
+        mockgen: MockStreamGenerator,
+        t_stripping: gt.QuSzTime,
+        prog_w0: gc.PhaseSpaceCoordinate,
+        prog_mass: u.Quantity,
+        rng_base: PRNGKeyArray,
+        vmapped: bool,
+    ) -> Callable[..., tuple[MockStream, gc.PhaseSpaceCoordinate]]:
+        """`MockStreamGenerator.run`, lowered and compiled once per class."""
+        run = type(mockgen).run.lower(
+            mockgen, rng_base, t_stripping, prog_w0, prog_mass, vmapped=vmapped
+        )
+        return partial(run.compile(), mockgen)
+
     # ========================================
 
     def test_run_scan(
         self,
-        mockgen: MockStreamGenerator,
+        compiled_run: Callable[..., tuple[MockStream, gc.PhaseSpaceCoordinate]],
         t_stripping: gt.QuSzTime,
         prog_w0: gc.PhaseSpaceCoordinate,
-        prog_mass: gt.MassSz0,
+        prog_mass: u.Quantity,
         rng: PRNGKeyArray,
-        vmapped: bool,
     ) -> None:
         """Test the run method with ``vmapped=False``."""
-        mock, prog_o = mockgen.run(
-            rng, t_stripping, prog_w0, prog_mass, vmapped=vmapped
-        )
+        mock, prog_o = compiled_run(rng, t_stripping, prog_w0, prog_mass)
 
         # TODO: more rigorous tests
         assert mock.q.shape == (2 * len(t_stripping),)
         assert prog_o.q.shape == ()  # scalar batch shape
 
-        # Test that the positions and momenta are finite
-        allfinite = lambda x: all(
-            jtu.flatten(jtu.map(lambda x: jnp.isfinite(x).all(), x))[0]
-        )
-        assert allfinite(mock.q)
-        assert allfinite(mock.p)
-        assert jnp.isfinite(mock.t).all()
+        # Test that the positions, momenta, and times are finite
+        assert _all_finite((mock.q, mock.p, mock.t))
 
 
 class TestFardalMockStreamGenerator(MockStreamGeneratorBase_Test):
     """Test the MockStreamGenerator class with FardalStreamDF."""
 
-    @pytest.fixture
-    def df(self) -> AbstractStreamDF:
+    @pytest.fixture(scope="class")
+    def df(self, fardal_df: FardalStreamDF) -> AbstractStreamDF:
         """Mock stream DF."""
-        return FardalStreamDF()
+        return fardal_df
 
 
 class TestChenMockStreamGenerator(MockStreamGeneratorBase_Test):
     """Test the MockStreamGenerator class with ChenStreamDF."""
 
-    @pytest.fixture
-    def df(self) -> AbstractStreamDF:
+    @pytest.fixture(scope="class")
+    def df(self, chen_df: ChenStreamDF) -> AbstractStreamDF:
         """Mock stream DF."""
-        with pytest.warns(RuntimeWarning):
-            return ChenStreamDF()
+        return chen_df
@@ -1,6 +1,7 @@
 """Test AbstractMultipolePotential."""
 
 import pytest
+from jax.scipy.special import sph_harm
 from jaxtyping import Array, Shaped
 
 import quaxed.numpy as jnp
@@ -8,6 +9,7 @@ import unxt as u
 
 import galax.potential as gp
 from ...param.test_field import ParameterFieldMixin
+from galax.potential._src.builtin.multipole import _ylm_sum
 
 
 class ParameterAngularCoefficientsMixin(ParameterFieldMixin):
@@ -110,3 +112,28 @@ class ParameterTlmMixin(ParameterAngularCoefficientsMixin):
         fields["Tlm"] = lambda t: Tlm * jnp.exp(-jnp.abs(t))
         pot = pot_cls(**fields)
         assert jnp.allclose(pot.Tlm(t=u.Quantity(0, "Myr")), Tlm)
+
+
+###############################################################################
+
+
+def test_ylm_sum() -> None:
+    """Test `_ylm_sum` against `jax.scipy.special.sph_harm`, point by point."""
+    l_max = 4
+    theta = jnp.linspace(0.1, 3.0, 5)
+    phi = jnp.linspace(-3.0, 3.0, 5)
+    s_pow = jnp.ones((1, l_max + 1, 5))
+    zeros = jnp.zeros((1, l_max + 1, l_max + 1))
+
+    for l, m in zip(*jnp.tril_indices(l_max + 1), strict=True):
+        onehot = zeros.at[0, l, m].set(1.0)
+        cYlm = _ylm_sum(jnp.cos(theta), phi, s_pow, onehot, zeros, l_max=l_max)
+        sYlm = _ylm_sum(jnp.cos(theta), phi, s_pow, zeros, onehot, l_max=l_max)
+        assert cYlm.shape == sYlm.shape == (5,)
+
+        for i in range(len(theta)):
+            Ylm = sph_harm(
+                m[None], l[None], phi[i : i + 1], theta[i : i + 1], n_max=l_max
+            )
+            assert jnp.allclose(cYlm[i], Ylm.real[0])
+            assert jnp.allclose(sYlm[i], Ylm.imag[0])
@@ -252,13 +252,27 @@ class TestMultipolePotential(
     # ==========================================================================
 
     def test_check_init(
-        self, pot_cls: type[gp.MultipoleInnerPotential], fields_: dict[str, Any]
+        self, pot_cls: type[gp.MultipoleInnerPotential], fields: dict[str, Any]
     ) -> None:
         """Test the `MultipoleInnerPotential.__check_init__` method."""
-        fields_["ISlm"] = fields_["ISlm"][::2]  # make it the wrong shape
+        fields["ISlm"] = fields["ISlm"][::2]  # make it the wrong shape
         match = re.escape("I/OSlm and I/OTlm must have the shape")
         with pytest.raises(ValueError, match=match):
-            pot_cls(**fields_)
+            pot_cls(**fields)
+
+    def test_upper_triangle_ignored(
+        self,
+        pot: gp.MultipolePotential,
+        pot_cls: type[gp.MultipolePotential],
+        fields: dict[str, Any],
+        x: gt.QuSz3,
+    ) -> None:
+        """Test that the ``m > l`` coefficients do not contribute."""
+        fields["ISlm"] = fields["ISlm"].at[0, 1].set(jnp.nan)
+        fields["OTlm"] = fields["OTlm"].at[1, 2].set(jnp.nan)
+        pot2 = pot_cls(**fields)
+        got, expect = pot2.potential(x, t=0), pot.potential(x, t=0)
+        assert jnp.allclose(got, expect, atol=u.Quantity(1e-8, expect.unit))
 
     # ==========================================================================
 
@@ -276,9 +290,11 @@ class TestMultipolePotential(
         assert jnp.allclose(got, expect, atol=u.Quantity(1e-8, expect.unit))
 
     def test_density(self, pot: gp.MultipolePotential, x: gt.QuSz3) -> None:
-        expect = u.Quantity(4.73805126e-05, pot.units["mass density"])
+        # The expansion is harmonic, so the density is zero up to autodiff
+        # round-off, which is tiny compared to m_tot / r_s^3 = 1e12 Msun / kpc3.
+        expect = u.Quantity(0.0, pot.units["mass density"])
         assert jnp.isclose(
-            pot.density(x, t=0), expect, atol=u.Quantity(1e-8, expect.unit)
+            pot.density(x, t=0), expect, atol=u.Quantity(1e-3, expect.unit)
         )
 
     def test_hessian(self, pot: gp.MultipolePotential, x: gt.QuSz3) -> None:
@@ -1,6 +1,8 @@
 from typing import Any
 
+import numpy as np
 import pytest
+from jaxtyping import Array
 from plum import convert
 
 import quaxed.numpy as jnp
@@ -9,7 +11,32 @@ import unxt as u
 import galax.typing as gt
 from ...test_core import AbstractSinglePotential_Test
 from ..test_common import ParameterMTotMixin, ParameterScaleRadiusMixin
-from galax.potential import AbstractPotential, HernquistPotential
+from galax.potential import HernquistPotential
+
+# The expected values at `x`, as (method name, value, unit-system dimension).
+EXPECTED: tuple[tuple[str, Any, str], ...] = (
+    ("potential", -0.94871936, "specific energy"),
+    ("gradient", [0.05347411, 0.10694822, 0.16042233], "acceleration"),
+    ("density", 3.989933e08, "mass density"),
+    (
+        "hessian",
+        [
+            [0.04362645, -0.01969533, -0.02954299],
+            [-0.01969533, 0.01408345, -0.05908599],
+            [-0.02954299, -0.05908599, -0.03515487],
+        ],
+        "frequency drift",
+    ),
+    (
+        "tidal_tensor",
+        [
+            [0.0361081, -0.01969533, -0.02954299],
+            [-0.01969533, 0.00656511, -0.05908599],
+            [-0.02954299, -0.05908599, -0.04267321],
+        ],
+        "frequency drift",
+    ),
+)
 
 
 class TestHernquistPotential(
@@ -26,53 +53,105 @@ class TestHernquistPotential(
     def fields_(self, field_m_tot, field_r_s, field_units) -> dict[str, Any]:
         return {"m_tot": field_m_tot, "r_s": field_r_s, "units": field_units}
 
+    @pytest.fixture(scope="class")
+    def precomputed(self, pot: HernquistPotential, x: gt.QuSz3) -> dict[str, Any]:
+        """Evaluate the potential's methods once, for all the tests in the class.
+
+        An exception is kept in place of its quantity, so that it fails only the
+        test of that quantity.
+        """
+        out: dict[str, Any] = {}
+        for name, *_ in EXPECTED:
+            try:
+                out[name] = convert(getattr(pot, name)(x, t=0), u.Quantity)
+            except Exception as e:  # noqa: BLE001
+                out[name] = e
+        return out
+
+    @pytest.fixture(scope="class")
+    def expected(self, pot: HernquistPotential) -> dict[str, u.Quantity]:
+        """Return the expected values of the precomputed quantities."""
+        return {name: u.Quantity(v, pot.units[dim]) for name, v, dim in EXPECTED}
+
+    @pytest.fixture(scope="class")
+    def atol(self, pot: HernquistPotential) -> dict[str, u.Quantity]:
+        """Return the absolute tolerances of the precomputed quantities."""
+        return {name: u.Quantity(1e-8, pot.units[dim]) for name, _, dim in EXPECTED}
+
+    @pytest.fixture(scope="class")
+    def isclose(
+        self,
+        precomputed: dict[str, Any],
+        expected: dict[str, u.Quantity],
+        atol: dict[str, u.Quantity],
+    ) -> dict[str, Array]:
+        """Compare all the precomputed quantities in one packed `jnp.isclose`.
+
+        A quantity whose evaluation raised is not close.
+        """
+        ok = {
+            k: v for k, v in expected.items() if isinstance(precomputed[k], u.Quantity)
+        }
+        got = [u.ustrip(v.unit, precomputed[k]).ravel() for k, v in ok.items()]
+        want = [v.value.ravel() for v in ok.values()]
+        tol = [
+            jnp.full(w.shape, u.ustrip(v.unit, atol[k]))
+            for w, (k, v) in zip(want, ok.items(), strict=True)
+        ]
+        close = jnp.isclose(jnp.concat(got), jnp.concat(want), atol=jnp.concat(tol))
+        splits = np.cumsum([w.size for w in want])[:-1]
+        out = dict(zip(ok, jnp.split(close, splits), strict=True))
+        return {k: out.get(k, jnp.array(False)) for k in expected}  # noqa: FBT003
+
     # ==========================================================================
 
-    def test_potential(self, pot: HernquistPotential, x: gt.QuSz3) -> None:
-        expect = u.Quantity(-0.94871936, pot.units["specific energy"])
-        assert jnp.isclose(
-            pot.potential(x, t=0), expect, atol=u.Quantity(1e-8, expect.unit)
-        )
-
-    def test_gradient(self, pot: HernquistPotential, x: gt.QuSz3) -> None:
-        expect = u.Quantity(
-            [0.05347411, 0.10694822, 0.16042233], pot.units["acceleration"]
-        )
-        got = convert(pot.gradient(x, t=0), u.Quantity)
-        assert jnp.allclose(got, expect, atol=u.Quantity(1e-8, expect.unit))
-
-    def test_density(self, pot: HernquistPotential, x: gt.QuSz3) -> None:
-        expect = u.Quantity(3.989933e08, pot.units["mass density"])
-        assert jnp.isclose(
-            pot.density(x, t=0), expect, atol=u.Quantity(1e-8, expect.unit)
-        )
-
-    def test_hessian(self, pot: HernquistPotential, x: gt.QuSz3) -> None:
-        expect = u.Quantity(
-            [
-                [0.04362645, -0.01969533, -0.02954299],
-                [-0.01969533, 0.01408345, -0.05908599],
-                [-0.02954299, -0.05908599, -0.03515487],
-            ],
-            "1/Myr2",
-        )
-        assert jnp.allclose(
-            pot.hessian(x, t=0), expect, atol=u.Quantity(1e-8, expect.unit)
-        )
+    def test_potential(
+        self,
+        isclose: dict[str, Array],
+        precomputed: dict[str, Any],
+        expected: dict[str, u.Quantity],
+    ) -> None:
+        got, want = precomputed["potential"], expected["potential"]
+        assert isclose["potential"].all(), f"potential: got {got}, expected {want}"
+
+    def test_gradient(
+        self,
+        isclose: dict[str, Array],
+        precomputed: dict[str, Any],
+        expected: dict[str, u.Quantity],
+    ) -> None:
+        got, want = precomputed["gradient"], expected["gradient"]
+        assert isclose["gradient"].all(), f"gradient: got {got}, expected {want}"
+
+    def test_density(
+        self,
+        isclose: dict[str, Array],
+        precomputed: dict[str, Any],
+        expected: dict[str, u.Quantity],
+    ) -> None:
+        got, want = precomputed["density"], expected["density"]
+        assert isclose["density"].all(), f"density: got {got}, expected {want}"
+
+    def test_hessian(
+        self,
+        isclose: dict[str, Array],
+        precomputed: dict[str, Any],
+        expected: dict[str, u.Quantity],
+    ) -> None:
+        got, want = precomputed["hessian"], expected["hessian"]
+        assert isclose["hessian"].all(), f"hessian: got {got}, expected {want}"
 
     # ---------------------------------
     # Convenience methods
 
-    def test_tidal_tensor(self, pot: AbstractPotential, x: gt.QuSz3) -> None:
+    def test_tidal_tensor(
+        self,
+        isclose: dict[str, Array],
+        precomputed: dict[str, Any],
+        expected: dict[str, u.Quantity],
+    ) -> None:
         """Test the `AbstractPotential.tidal_tensor` method."""
-        expect = u.Quantity(
-            [
-                [0.0361081, -0.01969533, -0.02954299],
-                [-0.01969533, 0.00656511, -0.05908599],
-                [-0.02954299, -0.05908599, -0.04267321],
-            ],
-            "1/Myr2",
-        )
-        assert jnp.allclose(
-            pot.tidal_tensor(x, t=0), expect, atol=u.Quantity(1e-8, expect.unit)
-        )
+        got, want = precomputed["tidal_tensor"], expected["tidal_tensor"]
+        assert isclose[
+            "tidal_tensor"
+        ].all(), f"tidal_tensor: got {got}, expected {want}"